@@ -1,10 +1,13 @@
 """UTCP Tool Adapter for Strands Agents SDK."""
 
 import asyncio
+import importlib.util
 import json
 import logging
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from utcp.data.tool import Tool as UTCPTool
 from utcp.data.utcp_client_config import UtcpClientConfig
@@ -15,33 +18,30 @@ from utcp_http.http_call_template import HttpCallTemplate
 from utcp_http.sse_call_template import SseCallTemplate
 from utcp_http.streamable_http_call_template import StreamableHttpCallTemplate
 
-# Optional imports for other protocols
-try:
-    from utcp_cli.cli_call_template import CliCallTemplate
-except ImportError:
-    CliCallTemplate = None
 
-try:
-    from utcp_gql.gql_call_template import GqlCallTemplate
-except ImportError:
-    GqlCallTemplate = None
+def _optional_import(module_name: str, attr_name: Optional[str] = None) -> Optional[Any]:
+    """Import an optional module (or an attribute from it), or return None if it isn't installed."""
+    # Probe the top-level package first so missing plugins don't pay for a failed import
+    if importlib.util.find_spec(module_name.partition(".")[0]) is None:
+        return None
+    try:
+        module = importlib.import_module(module_name)
+        return module if attr_name is None else getattr(module, attr_name)
+    except (ImportError, AttributeError):
+        # Installed, but an incompatible version
+        return None
 
-try:
-    from utcp_mcp.mcp_call_template import McpCallTemplate
-except ImportError:
-    McpCallTemplate = None
 
-try:
-    from utcp_socket.tcp_call_template import TcpCallTemplate
-    from utcp_socket.udp_call_template import UdpCallTemplate
-except ImportError:
-    TcpCallTemplate = None
-    UdpCallTemplate = None
+# Optional imports for other protocols
+CliCallTemplate = _optional_import("utcp_cli.cli_call_template", "CliCallTemplate")
+GqlCallTemplate = _optional_import("utcp_gql.gql_call_template", "GqlCallTemplate")
+McpCallTemplate = _optional_import("utcp_mcp.mcp_call_template", "McpCallTemplate")
+TcpCallTemplate = _optional_import("utcp_socket.tcp_call_template", "TcpCallTemplate")
+UdpCallTemplate = _optional_import("utcp_socket.udp_call_template", "UdpCallTemplate")
+TextCallTemplate = _optional_import("utcp_text.text_call_template", "TextCallTemplate")
 
-try:
-    from utcp_text.text_call_template import TextCallTemplate
-except ImportError:
-    TextCallTemplate = None
+# Optional faster JSON encoder for tool results
+orjson: Optional[ModuleType] = _optional_import("orjson")
 
 # Import Strands types for proper integration
 try:
@@ -60,6 +60,35 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _dumps_result(result: Any) -> str:
+    """Serialize a tool result as indented JSON, using orjson when it is installed.
+    
+    Both encoders write non-ASCII text as-is. With orjson, NaN and infinities become
+    ``null`` and exponents drop the ``+`` (``1e16`` rather than ``1e+16``).
+    """
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            return encoded.decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib encoder handle or report it
+            pass
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
+class _BedrockNameTable(dict):
+    """``str.translate`` table mapping every character outside ``[a-zA-Z0-9_-]`` to ``_``."""
+
+    def __missing__(self, codepoint: int) -> str:
+        # Only reached for non-ASCII code points, none of which Bedrock accepts
+        return "_"
+
+
+_BEDROCK_NAME_TABLE = _BedrockNameTable(
+    (c, chr(c) if chr(c).isalnum() or chr(c) in "_-" else "_") for c in range(128)
+)
+
+
 def format_tool_name_for_bedrock(tool_name: str) -> str:
     """Format a tool name to meet Bedrock's requirements.
     
@@ -67,28 +96,61 @@ def format_tool_name_for_bedrock(tool_name: str) -> str:
     - Be 64 characters or less
     - Match pattern ^[a-zA-Z0-9_-]{1,64}$
     """
-    # Replace periods with underscores (common in UTCP tool names)
-    bedrock_name = tool_name.replace(".", "_")
-    
-    # Remove any other invalid characters and replace with underscores
-    valid_chars = []
-    for char in bedrock_name:
-        if char.isalnum() or char in ['_', '-']:
-            valid_chars.append(char)
-        else:
-            valid_chars.append('_')
-    
-    bedrock_name = ''.join(valid_chars)
+    # Replace periods (common in UTCP tool names) and any other invalid
+    # characters with underscores in a single pass
+    bedrock_name = tool_name.translate(_BEDROCK_NAME_TABLE)
     
     # Truncate if longer than 64 characters
     if len(bedrock_name) > 64:
         # Use first 55 chars + underscore + 8-char UUID
-        short_uuid = str(uuid.uuid4()).replace('-', '')[:8]
-        bedrock_name = f"{bedrock_name[:55]}_{short_uuid}"
+        bedrock_name = f"{bedrock_name[:55]}_{uuid.uuid4().hex[:8]}"
     
     return bedrock_name
 
 
+class _CallTemplateSpec(NamedTuple):
+    """How to build a call template from its configuration dictionary."""
+
+    # None when the protocol's optional package isn't installed; such types are skipped
+    template_class: Optional[type]
+    required: Tuple[str, ...]
+    optional: Tuple[str, ...] = ()
+    defaults: Tuple[Tuple[str, Any], ...] = ()
+
+
+# Fields common to all HTTP-based call templates (http, sse, streamable_http)
+_HTTP_DEFAULTS = (("http_method", "GET"), ("content_type", "application/json"))
+_HTTP_OPTIONAL = ("auth", "headers", "body_field", "header_fields")
+
+_CALL_TEMPLATE_SPECS: Dict[str, _CallTemplateSpec] = {
+    "http": _CallTemplateSpec(
+        HttpCallTemplate, ("url",), _HTTP_OPTIONAL + ("auth_tools",), _HTTP_DEFAULTS
+    ),
+    "sse": _CallTemplateSpec(
+        SseCallTemplate, ("url",), _HTTP_OPTIONAL + ("event_type", "reconnect", "retry_timeout"), _HTTP_DEFAULTS
+    ),
+    "streamable_http": _CallTemplateSpec(
+        StreamableHttpCallTemplate, ("url",), _HTTP_OPTIONAL + ("chunk_size", "timeout"), _HTTP_DEFAULTS
+    ),
+    "cli": _CallTemplateSpec(CliCallTemplate, ("command",)),
+    "graphql": _CallTemplateSpec(GqlCallTemplate, ("url",)),
+    "mcp": _CallTemplateSpec(McpCallTemplate, ("command",)),
+    "tcp": _CallTemplateSpec(TcpCallTemplate, ("host", "port")),
+    "udp": _CallTemplateSpec(UdpCallTemplate, ("host", "port")),
+    "text": _CallTemplateSpec(TextCallTemplate, ("file_path",)),
+}
+
+
+# Maximum number of distinct (query, limit) search results kept per adapter
+_SEARCH_CACHE_SIZE = 128
+
+# Map invalid JSON Schema types to valid ones
+_SCHEMA_TYPE_MAPPING = {
+    "file": "string",  # Files are represented as strings in JSON Schema
+    None: "string",    # Default fallback, also used when the schema has no type
+}
+
+
 class UtcpToolAdapterError(Exception):
     """Exception for UTCP tool adapter errors."""
     pass
@@ -97,44 +159,45 @@ class UtcpToolAdapterError(Exception):
 class UtcpAgentTool(AgentTool):
     """Wrapper for UTCP tools to be used with Strands agents."""
     
+    # AgentTool itself doesn't declare slots, so instances keep a (small) __dict__ for
+    # its own state; the per-tool attributes below are slot-backed.
+    __slots__ = ("utcp_tool", "adapter", "_name", "_description", "_schema", "_tool_spec")
+    
     def __init__(self, utcp_tool: UTCPTool, adapter: "UtcpToolAdapter"):
         super().__init__()
         self.utcp_tool = utcp_tool
         self.adapter = adapter
+        # Name sanitization and schema conversion are pure functions of the UTCP tool,
+        # so compute them once instead of on every property access. The name is needed
+        # for lookups straight away; the schema is built on first use, since most loaded
+        # tools are never handed to a model.
+        self._name = format_tool_name_for_bedrock(utcp_tool.name)
+        self._description = utcp_tool.description or f"Tool: {utcp_tool.name}"
+        self._schema: Optional[Dict[str, Any]] = None
+        self._tool_spec: Optional[ToolSpec] = None
         
     @property
     def name(self) -> str:
         """Tool name, sanitized for Bedrock compatibility."""
-        return format_tool_name_for_bedrock(self.utcp_tool.name)
+        return self._name
     
     @property
     def tool_name(self) -> str:
         """Tool name, sanitized for Bedrock compatibility."""
-        return self.name
+        return self._name
     
     def _convert_schema_to_dict(self, schema_obj) -> Dict[str, Any]:
         """Convert UTCP JsonSchema object to plain dictionary."""
-        if hasattr(schema_obj, 'type'):
-            # Map invalid JSON Schema types to valid ones
-            type_mapping = {
-                "file": "string",  # Files are represented as strings in JSON Schema
-                None: "string"     # Default fallback
-            }
-            schema_type = type_mapping.get(schema_obj.type, schema_obj.type)
-            
-            result = {"type": schema_type}
-            if hasattr(schema_obj, 'description') and schema_obj.description:
-                result["description"] = schema_obj.description
-            if hasattr(schema_obj, 'enum') and schema_obj.enum:
-                result["enum"] = schema_obj.enum
-            if hasattr(schema_obj, 'format') and schema_obj.format:
-                result["format"] = schema_obj.format
-            return result
-        return {"type": "string"}  # fallback
+        schema_type = getattr(schema_obj, 'type', None)
+        result = {"type": _SCHEMA_TYPE_MAPPING.get(schema_type, schema_type)}
+        for field in ("description", "enum", "format"):
+            value = getattr(schema_obj, field, None)
+            if value:
+                result[field] = value
+        return result
     
-    @property
-    def tool_spec(self) -> ToolSpec:
-        """Tool specification in Strands format."""
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build the JSON Schema dict for the tool inputs."""
         # Convert properties to plain dictionaries
         properties = {}
         if self.utcp_tool.inputs.properties:
@@ -151,11 +214,18 @@ class UtcpAgentTool(AgentTool):
         if self.utcp_tool.inputs.description:
             schema["description"] = self.utcp_tool.inputs.description
             
-        return {
-            "inputSchema": {"json": schema},
-            "name": self.tool_name,
-            "description": self.description,
-        }
+        return schema
+    
+    @property
+    def tool_spec(self) -> ToolSpec:
+        """Tool specification in Strands format."""
+        if self._tool_spec is None:
+            self._tool_spec = {
+                "inputSchema": {"json": self.input_schema},
+                "name": self._name,
+                "description": self._description,
+            }
+        return self._tool_spec
     
     @property
     def tool_type(self) -> str:
@@ -165,63 +235,44 @@ class UtcpAgentTool(AgentTool):
     @property
     def description(self) -> str:
         """Tool description."""
-        return self.utcp_tool.description or f"Tool: {self.utcp_tool.name}"
+        return self._description
     
     @property
     def input_schema(self) -> Dict[str, Any]:
         """Tool input schema in JSON Schema format."""
-        # Convert properties to plain dictionaries
-        properties = {}
-        if self.utcp_tool.inputs.properties:
-            for key, value in self.utcp_tool.inputs.properties.items():
-                properties[key] = self._convert_schema_to_dict(value)
-        
-        schema = {
-            "type": "object",  # Always object for tool inputs
-            "properties": properties,
-        }
-        
-        if self.utcp_tool.inputs.required:
-            schema["required"] = self.utcp_tool.inputs.required
-        if self.utcp_tool.inputs.description:
-            schema["description"] = self.utcp_tool.inputs.description
+        if self._schema is None:
+            self._schema = self._build_schema()
+        return self._schema
+    
+    async def _invoke(self, tool_use_id: str, tool_input: Dict[str, Any]) -> ToolResult:
+        """Execute the tool and build its ToolResult, reporting failures as an error result."""
+        try:
+            result = await self.adapter.call_tool(self.utcp_tool.name, tool_input)
             
-        return schema
+            # Format result as ToolResult
+            if isinstance(result, str):
+                content = result
+            elif isinstance(result, dict):
+                content = _dumps_result(result)
+            else:
+                content = str(result)
+            
+            return {
+                "toolUseId": tool_use_id,
+                "content": [{"text": content}],
+                "status": "success"
+            }
+        except Exception as e:
+            return {
+                "toolUseId": tool_use_id,
+                "content": [{"text": f"Error: {e}"}],
+                "status": "error"
+            }
     
-    def stream(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolGenerator:
+    async def stream(self, tool_use: ToolUse, invocation_state: Dict[str, Any], **kwargs: Any) -> ToolGenerator:
         """Stream tool execution for Strands."""
-        async def _execute():
-            try:
-                result = await self.adapter.call_tool(
-                    self.utcp_tool.name, 
-                    tool_use.get("input", {})
-                )
-                
-                # Format result as ToolResult
-                if isinstance(result, str):
-                    content = result
-                elif isinstance(result, dict):
-                    content = json.dumps(result, indent=2)
-                else:
-                    content = str(result)
-                
-                tool_result = {
-                    "toolUseId": tool_use.get("toolUseId", "unknown"),
-                    "content": [{"text": content}],
-                    "status": "success"
-                }
-                
-                yield ToolResultEvent(tool_result)
-                
-            except Exception as e:
-                error_result = {
-                    "toolUseId": tool_use.get("toolUseId", "unknown"),
-                    "content": [{"text": f"Error: {str(e)}"}],
-                    "status": "error"
-                }
-                yield ToolResultEvent(error_result)
-        
-        return _execute()
+        # Strands consumes tools as async generators; this one yields just the final result
+        yield ToolResultEvent(await self._invoke(tool_use.get("toolUseId", "unknown"), tool_use.get("input", {})))
     
     async def call(self, **kwargs) -> Any:
         """Execute the tool with given arguments."""
@@ -241,7 +292,11 @@ class UtcpToolAdapter:
         """
         self._config = config or {}
         self._utcp_client: Optional[UtcpClient] = None
-        self._tools_cache: List[UtcpAgentTool] = []
+        # Read-only, so list_tools() can hand it out without copying
+        self._tools_cache: Tuple[UtcpAgentTool, ...] = ()
+        self._by_bedrock_name: Dict[str, UtcpAgentTool] = {}
+        self._by_utcp_name: Dict[str, UtcpAgentTool] = {}
+        self._search_cache: "OrderedDict[Tuple[str, int], List[UtcpAgentTool]]" = OrderedDict()
         logger.debug("Initializing UTCP tool adapter with config: %s", config)
 
     async def __aenter__(self) -> "UtcpToolAdapter":
@@ -252,114 +307,46 @@ class UtcpToolAdapter:
         """Async context manager exit."""
         await self.stop()
 
-    def _build_http_base_kwargs(self, template_config: Dict[str, Any], call_template_type: str) -> Dict[str, Any]:
-        """Build base kwargs common to all HTTP-based call templates (http, sse, streamable_http)."""
+    def _build_call_template(self, template_config: Dict[str, Any]) -> Optional[Any]:
+        """Build a call template from its configuration, or None if the type is unavailable."""
+        call_template_type = template_config.get("call_template_type")
+        spec = _CALL_TEMPLATE_SPECS.get(call_template_type) if call_template_type is not None else None
+        if spec is None or spec.template_class is None:
+            logger.warning("Unsupported or unavailable call template type: %s", call_template_type)
+            return None
+        
         kwargs = {
             "name": template_config["name"],
             "call_template_type": call_template_type,
-            "url": template_config["url"],
-            "http_method": template_config.get("http_method", "GET"),
-            "content_type": template_config.get("content_type", "application/json"),
         }
-        
-        # Add common optional fields
-        for field in ["auth", "headers", "body_field", "header_fields"]:
+        for field in spec.required:
+            kwargs[field] = template_config[field]
+        for field, default in spec.defaults:
+            kwargs[field] = template_config.get(field, default)
+        for field in spec.optional:
             if field in template_config:
                 kwargs[field] = template_config[field]
         
-        return kwargs
+        return spec.template_class(**kwargs)
+
+    def _build_call_templates(self) -> List[Any]:
+        """Build the call templates for all configured manuals, skipping unavailable types."""
+        call_templates = []
+        for template_config in self._config.get("manual_call_templates", []):
+            call_template = self._build_call_template(template_config)
+            if call_template is not None:
+                call_templates.append(call_template)
+        return call_templates
 
     async def start(self) -> "UtcpToolAdapter":
         """Initialize and start the UTCP client."""
         try:
-            # Convert manual call templates
-            call_templates = []
-            for template_config in self._config.get("manual_call_templates", []):
-                call_template_type = template_config.get("call_template_type")
-                
-                if call_template_type == "http":
-                    http_kwargs = self._build_http_base_kwargs(template_config, "http")
-                    if "auth_tools" in template_config:
-                        http_kwargs["auth_tools"] = template_config["auth_tools"]
-                    
-                    call_template = HttpCallTemplate(**http_kwargs)
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "sse":
-                    sse_kwargs = self._build_http_base_kwargs(template_config, "sse")
-                    for field in ["event_type", "reconnect", "retry_timeout"]:
-                        if field in template_config:
-                            sse_kwargs[field] = template_config[field]
-                    
-                    call_template = SseCallTemplate(**sse_kwargs)
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "streamable_http":
-                    streamable_kwargs = self._build_http_base_kwargs(template_config, "streamable_http")
-                    for field in ["chunk_size", "timeout"]:
-                        if field in template_config:
-                            streamable_kwargs[field] = template_config[field]
-                    
-                    call_template = StreamableHttpCallTemplate(**streamable_kwargs)
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "cli" and CliCallTemplate:
-                    call_template = CliCallTemplate(
-                        name=template_config["name"],
-                        call_template_type="cli",
-                        command=template_config["command"],
-                    )
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "graphql" and GqlCallTemplate:
-                    call_template = GqlCallTemplate(
-                        name=template_config["name"],
-                        call_template_type="graphql",
-                        url=template_config["url"],
-                    )
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "mcp" and McpCallTemplate:
-                    call_template = McpCallTemplate(
-                        name=template_config["name"],
-                        call_template_type="mcp",
-                        command=template_config["command"],
-                    )
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "tcp" and TcpCallTemplate:
-                    call_template = TcpCallTemplate(
-                        name=template_config["name"],
-                        call_template_type="tcp",
-                        host=template_config["host"],
-                        port=template_config["port"],
-                    )
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "udp" and UdpCallTemplate:
-                    call_template = UdpCallTemplate(
-                        name=template_config["name"],
-                        call_template_type="udp",
-                        host=template_config["host"],
-                        port=template_config["port"],
-                    )
-                    call_templates.append(call_template)
-                
-                elif call_template_type == "text" and TextCallTemplate:
-                    call_template = TextCallTemplate(
-                        name=template_config["name"],
-                        call_template_type="text",
-                        file_path=template_config["file_path"],
-                    )
-                    call_templates.append(call_template)
-                
-                else:
-                    logger.warning("Unsupported or unavailable call template type: %s", call_template_type)
-
             # Create UTCP client config
-            utcp_config = UtcpClientConfig(manual_call_templates=call_templates)
+            utcp_config = UtcpClientConfig(manual_call_templates=self._build_call_templates())
             
-            # Initialize UTCP client
+            # Initialize UTCP client. All manuals go into a single client so tool calls
+            # resolve against one registry; UtcpClient.create already registers them
+            # concurrently, so startup is bounded by the slowest manual, not their sum.
             self._utcp_client = await UtcpClient.create(config=utcp_config)
             
             # Load tools
@@ -375,8 +362,19 @@ class UtcpToolAdapter:
     async def stop(self) -> None:
         """Stop and cleanup the UTCP client."""
         if self._utcp_client:
+            # UtcpClient.close() only exists from utcp 1.2.0; older clients have nothing to release
+            close = getattr(self._utcp_client, "close", None)
+            if close is not None:
+                try:
+                    # Releases the communication protocols (and their HTTP sessions) the client owns
+                    await close()
+                except Exception as e:
+                    logger.warning("Failed to close UTCP client cleanly: %s", e)
             self._utcp_client = None
-            self._tools_cache.clear()
+            self._tools_cache = ()
+            self._by_bedrock_name.clear()
+            self._by_utcp_name.clear()
+            self._search_cache.clear()
             logger.info("UTCP tool adapter stopped")
 
     async def _load_tools(self) -> None:
@@ -384,33 +382,39 @@ class UtcpToolAdapter:
         if not self._utcp_client:
             return
             
+        self._search_cache.clear()
         try:
             utcp_tools = await self._utcp_client.search_tools(query="", limit=1000)
-            self._tools_cache = [UtcpAgentTool(tool, self) for tool in utcp_tools]
+            self._tools_cache = tuple(UtcpAgentTool(tool, self) for tool in utcp_tools)
             logger.debug("Loaded %d tools from UTCP client", len(self._tools_cache))
         except Exception as e:
             logger.error("Failed to load tools: %s", e)
-            self._tools_cache = []
+            self._tools_cache = ()
+        # Build in reverse so the first tool claiming a name wins, as with a linear scan
+        self._by_bedrock_name = {tool.tool_name: tool for tool in reversed(self._tools_cache)}
+        self._by_utcp_name = {tool.utcp_tool.name: tool for tool in reversed(self._tools_cache)}
 
-    def list_tools(self) -> List[UtcpAgentTool]:
-        """Get list of available tools."""
-        return self._tools_cache.copy()
+    def list_tools(self) -> Tuple[UtcpAgentTool, ...]:
+        """Get available tools as a read-only tuple (not copied per call)."""
+        return self._tools_cache
 
     def get_tool(self, name: str) -> Optional[UtcpAgentTool]:
-        """Get a specific tool by name."""
-        for tool in self._tools_cache:
-            if tool.tool_name == name or tool.utcp_tool.name == name:
-                return tool
-        return None
+        """Get a specific tool by its sanitized or original UTCP name."""
+        return self._by_bedrock_name.get(name) or self._by_utcp_name.get(name)
 
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        """Execute a tool with given arguments."""
+    def _ensure_initialized(self) -> UtcpClient:
+        """Return the running UTCP client, raising if the adapter hasn't been started."""
         if not self._utcp_client:
             raise UtcpToolAdapterError("UTCP client not initialized")
+        return self._utcp_client
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Execute a tool with given arguments."""
+        client = self._ensure_initialized()
 
         try:
             logger.debug("Calling tool %s with arguments: %s", tool_name, arguments)
-            result = await self._utcp_client.call_tool(tool_name=tool_name, tool_args=arguments)
+            result = await client.call_tool(tool_name=tool_name, tool_args=arguments)
             logger.debug("Tool %s returned: %s", tool_name, result)
             return result
         except Exception as e:
@@ -419,17 +423,32 @@ class UtcpToolAdapter:
 
     async def search_tools(self, query: str, max_results: Optional[int] = None) -> List[UtcpAgentTool]:
         """Search for tools matching the query."""
-        if not self._utcp_client:
-            raise UtcpToolAdapterError("UTCP client not initialized")
+        client = self._ensure_initialized()
+
+        limit = max_results or 100
+        key = (query, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            # The registered manuals don't change while the client is running
+            self._search_cache.move_to_end(key)
+            return list(cached)
 
         try:
-            limit = max_results or 100
-            utcp_tools = await self._utcp_client.search_tools(query=query, limit=limit)
-            return [UtcpAgentTool(tool, self) for tool in utcp_tools]
+            utcp_tools = await client.search_tools(query=query, limit=limit)
+            # Reuse the wrappers created at load time rather than rebuilding them
+            results = [self._by_utcp_name.get(tool.name) or UtcpAgentTool(tool, self) for tool in utcp_tools]
         except Exception as e:
             logger.error("Failed to search tools: %s", e)
             return []
 
+        self._search_cache[key] = results
+        if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
+
     def to_strands_tools(self) -> List[UtcpAgentTool]:
-        """Convert UTCP tools to Strands-compatible tool objects."""
-        return self._tools_cache.copy()
+        """Convert UTCP tools to Strands-compatible tool objects.
+
+        Returns a new list on each call, so it can be extended before handing it to an Agent.
+        """
+        return list(self._tools_cache)
@@ -0,0 +1,83 @@
+"""Shared fixtures and hooks for UTCP tool adapter tests."""
+
+import gc
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from utcp.utcp_client import UtcpClient
+
+from strands_utcp import utcp_tool_adapter
+
+from .doubles import ADAPTER_CONFIG, TEST_TOOL, FastAsyncMock
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cleanup-mocks",
+        action="store_true",
+        default=False,
+        help="Run a garbage collection after every test to free discarded mock trees.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _cleanup_mocks(request):
+    """Collect the reference cycles mocks leave behind, when --cleanup-mocks is given.
+    
+    Off by default: a collection per test costs more than it saves on a small suite.
+    """
+    yield
+    
+    if request.config.getoption("--cleanup-mocks"):
+        gc.collect()
+
+
+@pytest.fixture(scope="session")
+def adapter_config():
+    """Sample adapter configuration."""
+    return ADAPTER_CONFIG
+
+
+@pytest.fixture(scope="session")
+def mock_utcp_tool():
+    """Mock UTCP tool."""
+    return TEST_TOOL
+
+
+@pytest.fixture(scope="session")
+def utcp_tools():
+    """Tools returned by the mocked client's search_tools; a tuple so tests can't mutate it."""
+    return (TEST_TOOL,)
+
+
+async def _unexpected_create(*args, **kwargs):
+    # pytest.fail raises a BaseException, so start() can't swallow it into UtcpToolAdapterError
+    pytest.fail("UtcpClient.create called without a test client; use patched_utcp or stub_client")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def utcp_client_class():
+    """Replace UtcpClient once per module so no test can reach a real client.
+    
+    ``create`` fails the test if it is ever reached; tests that start an adapter patch
+    ``create`` on this object for their own duration.
+    """
+    client_class = SimpleNamespace(create=_unexpected_create)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(utcp_tool_adapter, "UtcpClient", client_class)
+        yield client_class
+
+
+@pytest.fixture
+def patched_utcp(monkeypatch, utcp_client_class):
+    """Give one test its own tracked mock client.
+    
+    Returns ``(mock_client_class, mock_client)``; ``UtcpClient.create`` returns the mock
+    client, whose ``search_tools`` returns no tools unless a test overrides it.
+    """
+    mock_client = AsyncMock(spec=UtcpClient)
+    mock_client.search_tools.return_value = ()
+    monkeypatch.setattr(utcp_client_class, "create", FastAsyncMock(return_value=mock_client))
+    return utcp_client_class, mock_client
@@ -0,0 +1,63 @@
+"""Test doubles and shared test data for UTCP tool adapter tests."""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+
+@dataclass(frozen=True, slots=True)
+class FakeInputs:
+    """Plain stand-in for a UTCP tool's input schema."""
+    type: str = "object"
+    properties: Dict[str, Any] = field(default_factory=dict)
+    required: List[str] = field(default_factory=list)
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class FakeUtcpTool:
+    """Plain stand-in for a UTCP tool; cheaper than a MagicMock attribute tree."""
+    name: str
+    description: Optional[str] = None
+    inputs: FakeInputs = field(default_factory=FakeInputs)
+
+
+# Read-only so the session-scoped adapter_config fixture can be shared safely
+ADAPTER_CONFIG = MappingProxyType({
+    "manual_call_templates": (
+        MappingProxyType({
+            "name": "test_api",
+            "call_template_type": "http",
+            "url": "https://api.test.com/utcp",
+            "http_method": "GET"
+        }),
+    )
+})
+
+# Shared by every test; frozen, so one instance is safe to share
+TEST_TOOL = FakeUtcpTool(
+    "test_tool",
+    "Test tool description",
+    FakeInputs(
+        properties={"param1": {"type": "string"}},
+        required=["param1"],
+        description="Test input schema",
+    ),
+)
+
+
+class FastAsyncMock(MagicMock):
+    """MagicMock whose calls return a coroutine resolving to the usual mock result.
+    
+    Cheaper than AsyncMock, which also tracks awaits; use AsyncMock where a test needs
+    ``assert_awaited_*``. Calls are recorded when the coroutine is awaited.
+    """
+    
+    def __call__(self, *args, **kwargs):
+        sup = super()
+        
+        async def coro():
+            return sup.__call__(*args, **kwargs)
+        
+        return coro()
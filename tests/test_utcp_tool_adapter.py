@@ -1,413 +1,537 @@
 """Unit tests for UTCP tool adapter."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import copy
+import json
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 import pytest
+import pytest_asyncio
+
+from utcp.data.tool import JsonSchema
+from utcp.utcp_client import UtcpClient
+from utcp_http.http_call_template import HttpCallTemplate
+from utcp_http.sse_call_template import SseCallTemplate
+from utcp_http.streamable_http_call_template import StreamableHttpCallTemplate
+
+from strands_utcp import UtcpToolAdapter, UtcpToolAdapterError, utcp_tool_adapter
+from strands_utcp.utcp_tool_adapter import UtcpAgentTool, _optional_import, format_tool_name_for_bedrock
+
+from .doubles import ADAPTER_CONFIG, FakeInputs, FakeUtcpTool, FastAsyncMock
+
+
+# Input schema UtcpAgentTool builds for TEST_TOOL
+EXPECTED_SCHEMA = {
+    "type": "object",
+    "properties": {"param1": {"type": "string"}},
+    "required": ["param1"],
+    "description": "Test input schema",
+}
+
+# Fully populated manual call templates for the auth passthrough tests
+_HTTP_TEMPLATE = MappingProxyType({
+    "name": "test_api",
+    "call_template_type": "http",
+    "url": "https://api.test.com/utcp",
+    "http_method": "POST",
+    "auth": {
+        "auth_type": "api_key",
+        "api_key": "Bearer ${MY_BEARER_TOKEN}",
+        "var_name": "Authorization",
+        "location": "header"
+    },
+    "auth_tools": ["tool1", "tool2"],
+    "headers": {"X-Custom-Header": "value"},
+    "body_field": "data",
+    "header_fields": ["X-Request-ID"]
+})
+
+_SSE_TEMPLATE = MappingProxyType({
+    "name": "test_sse",
+    "call_template_type": "sse",
+    "url": "https://api.test.com/sse",
+    "http_method": "GET",
+    "auth": {
+        "auth_type": "bearer",
+        "token": "${MY_TOKEN}"
+    },
+    "headers": {"Accept": "text/event-stream"},
+    "body_field": "payload",
+    "header_fields": ["X-Event-ID"],
+    "event_type": "message",
+    "reconnect": True,
+    "retry_timeout": 5000
+})
+
+_STREAMABLE_HTTP_TEMPLATE = MappingProxyType({
+    "name": "test_streamable",
+    "call_template_type": "streamable_http",
+    "url": "https://api.test.com/stream",
+    "http_method": "POST",
+    "auth": {
+        "auth_type": "basic",
+        "username": "${MY_USERNAME}",
+        "password": "${MY_PASSWORD}"
+    },
+    "headers": {"Content-Type": "application/octet-stream"},
+    "body_field": "chunk",
+    "header_fields": ["X-Chunk-Size"],
+    "chunk_size": 8192,
+    "timeout": 30.0
+})
+
+# One manual of each HTTP-family type
+_MIXED_TEMPLATES_CONFIG = MappingProxyType({
+    "manual_call_templates": (
+        {
+            "name": "api1",
+            "call_template_type": "http",
+            "url": "http://api1.com"
+        },
+        {
+            "name": "sse1",
+            "call_template_type": "sse",
+            "url": "http://sse1.com"
+        },
+        {
+            "name": "stream1",
+            "call_template_type": "streamable_http",
+            "url": "http://stream.com"
+        },
+    )
+})
+
+
+class StubClient:
+    """Hand-rolled UtcpClient stand-in for tests that never assert on client calls."""
+    
+    def __init__(self, tools=(), call_result=None):
+        self.tools = tools
+        self.call_result = call_result
+    
+    async def search_tools(self, query, limit=10, any_of_tags_required=None):
+        return self.tools
+    
+    async def call_tool(self, tool_name, tool_args):
+        return self.call_result
+    
+    async def close(self):
+        pass
+    
+    async def create(self, *args, **kwargs):
+        """Stand-in for the ``UtcpClient.create`` factory; always hands out this client."""
+        return self
+
 
-from strands_utcp import UtcpToolAdapter, UtcpToolAdapterError
+def _prewire(client, config=None):
+    """Adapter wired straight to ``client``, skipping start() and its initial tool load."""
+    adapter = UtcpToolAdapter(config)
+    adapter._utcp_client = client
+    return adapter
+
+
+@pytest.fixture(scope="session")
+def _agent_tool_prototype(mock_utcp_tool):
+    """UtcpAgentTool for the shared test tool; never used directly, so its schema stays unbuilt."""
+    return UtcpAgentTool(mock_utcp_tool, object())
 
 
 @pytest.fixture
-def adapter_config():
-    """Sample adapter configuration."""
-    return {
-        "manual_call_templates": [
-            {
-                "name": "test_api",
-                "call_template_type": "http",
-                "url": "https://api.test.com/utcp",
-                "http_method": "GET"
-            }
-        ]
-    }
+def agent_tool(_agent_tool_prototype):
+    """Fresh copy of the prototype; each copy builds and caches its own schema."""
+    return copy.copy(_agent_tool_prototype)
 
 
 @pytest.fixture
-def mock_utcp_tool():
-    """Mock UTCP tool."""
-    tool = MagicMock()
-    tool.name = "test_tool"
-    tool.description = "Test tool description"
-    tool.inputs.type = "object"
-    tool.inputs.properties = {"param1": {"type": "string"}}
-    tool.inputs.required = ["param1"]
-    tool.inputs.description = "Test input schema"
-    return tool
-
-
-def test_adapter_initialization(adapter_config):
-    """Test UtcpToolAdapter initialization."""
-    adapter = UtcpToolAdapter(adapter_config)
-    assert adapter._config == adapter_config
-    assert adapter._utcp_client is None
-    assert adapter._tools_cache == []
+def stub_client(monkeypatch, utcp_client_class):
+    """Patch UtcpClient.create to return a StubClient, without call tracking."""
+    client = StubClient()
+    monkeypatch.setattr(utcp_client_class, "create", client.create)
+    return client
 
 
-def test_adapter_initialization_empty_config():
-    """Test UtcpToolAdapter initialization with empty config."""
-    adapter = UtcpToolAdapter()
-    assert adapter._config == {}
+def capture(calls):
+    """Return a stand-in template class that records its kwargs in ``calls`` and returns them."""
+    def template_class(**kwargs):
+        calls.append(kwargs)
+        return kwargs
+    return template_class
+
+
+@pytest.fixture
+def template_kwargs(monkeypatch):
+    """Swap the HTTP-family call template classes for kwargs recorders.
+    
+    Returns a dict mapping each patched call template type to the list of kwargs its
+    class was called with.
+    """
+    specs = utcp_tool_adapter._CALL_TEMPLATE_SPECS
+    captured = {}
+    for template_type in ("http", "sse", "streamable_http"):
+        captured[template_type] = []
+        monkeypatch.setitem(
+            specs, template_type, specs[template_type]._replace(template_class=capture(captured[template_type]))
+        )
+    return captured
+
+
+@pytest_asyncio.fixture(scope="module")
+async def started_adapter(adapter_config, utcp_tools):
+    """Adapter wired to a mock client with its tools loaded, once per module.
+    
+    Yields ``(adapter, mock_client)``. Tests share the instance; ``_reset_started_adapter``
+    clears mock call history and the search cache after each test that uses it.
+    """
+    mock_client = AsyncMock(spec=UtcpClient)
+    mock_client.search_tools.return_value = utcp_tools
+    # Same state start() leaves behind, without patching UtcpClient.create at module scope
+    adapter = _prewire(mock_client, adapter_config)
+    await adapter._load_tools()
+    # Tests only care about their own calls, not the initial tool load
+    mock_client.reset_mock()
+    
+    yield adapter, mock_client
+    
+    await adapter.stop()
+
+
+@pytest.fixture(autouse=True)
+def _reset_started_adapter(request):
+    """Undo per-test state on the shared started adapter, if the test used it."""
+    yield
+    
+    if "started_adapter" in request.fixturenames:
+        adapter, mock_client = request.getfixturevalue("started_adapter")
+        adapter._search_cache.clear()
+        mock_client.reset_mock(return_value=True, side_effect=True)
+        mock_client.search_tools.return_value = request.getfixturevalue("utcp_tools")
+
+
+@pytest.mark.parametrize("config, expected", [
+    (ADAPTER_CONFIG, ADAPTER_CONFIG),
+    (None, {}),
+], ids=["config", "empty_config"])
+def test_adapter_initialization(config, expected):
+    """Test UtcpToolAdapter initialization with and without a config."""
+    adapter = UtcpToolAdapter(config) if config is not None else UtcpToolAdapter()
+    assert adapter._config == expected
     assert adapter._utcp_client is None
+    assert adapter._tools_cache == ()
 
 
-@pytest.mark.asyncio
-async def test_adapter_context_manager(adapter_config):
+async def test_adapter_context_manager(adapter_config, patched_utcp):
     """Test UtcpToolAdapter as async context manager."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        async with UtcpToolAdapter(adapter_config) as adapter:
-            assert adapter._utcp_client is not None
-            mock_client_class.create.assert_called_once()
-        
-        # After context exit, client should be cleaned up
-        assert adapter._utcp_client is None
+    mock_client_class, mock_client = patched_utcp
+    
+    async with UtcpToolAdapter(adapter_config) as adapter:
+        assert adapter._utcp_client is not None
+        mock_client_class.create.assert_called_once()
+    
+    # After context exit, client should be closed and cleaned up
+    mock_client.close.assert_awaited_once()
+    assert adapter._utcp_client is None
 
 
-@pytest.mark.asyncio
-async def test_adapter_start_success(adapter_config, mock_utcp_tool):
-    """Test successful adapter start."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = [mock_utcp_tool]
-        
-        adapter = UtcpToolAdapter(adapter_config)
+async def test_adapter_stop_close_failure(adapter_config, patched_utcp):
+    """Test that a failing client close does not prevent adapter cleanup."""
+    _, mock_client = patched_utcp
+    mock_client.close.side_effect = RuntimeError("close failed")
+    
+    adapter = await UtcpToolAdapter(adapter_config).start()
+    await adapter.stop()
+    
+    assert adapter._utcp_client is None
+
+
+async def test_adapter_stop_client_without_close(adapter_config, caplog):
+    """Test that stop() cleans up without warning when the client predates UtcpClient.close()."""
+    # A utcp < 1.2 client: no close() to await
+    adapter = _prewire(SimpleNamespace(), adapter_config)
+    
+    await adapter.stop()
+    
+    assert adapter._utcp_client is None
+    assert "Failed to close" not in caplog.text
+
+
+@pytest.mark.parametrize("create_error", [None, Exception("Connection failed")], ids=["success", "failure"])
+async def test_adapter_start(adapter_config, utcp_tools, patched_utcp, create_error):
+    """Test adapter start, both when the client comes up and when it fails to."""
+    mock_client_class, mock_client = patched_utcp
+    mock_client.search_tools.return_value = utcp_tools
+    mock_client_class.create.side_effect = create_error
+    
+    adapter = UtcpToolAdapter(adapter_config)
+    
+    if create_error is None:
         result = await adapter.start()
         
         assert result is adapter
         assert adapter._utcp_client is not None
         assert len(adapter._tools_cache) == 1
         mock_client_class.create.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_adapter_start_failure(adapter_config):
-    """Test adapter start failure."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client_class.create.side_effect = Exception("Connection failed")
-        
-        adapter = UtcpToolAdapter(adapter_config)
         
-        with pytest.raises(UtcpToolAdapterError, match="UTCP tool adapter initialization failed"):
+        # start() hands the templates built from the config to the client
+        (template,) = mock_client_class.create.call_args.kwargs["config"].manual_call_templates
+        expected = adapter_config["manual_call_templates"][0]
+        assert isinstance(template, HttpCallTemplate)
+        assert template.name == expected["name"]
+        assert template.url == expected["url"]
+    else:
+        with pytest.raises(UtcpToolAdapterError) as exc_info:
             await adapter.start()
+        assert str(exc_info.value) == "UTCP tool adapter initialization failed: Connection failed"
 
 
-@pytest.mark.asyncio
-async def test_list_tools(adapter_config, mock_utcp_tool):
-    """Test listing tools."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = [mock_utcp_tool]
-        
-        async with UtcpToolAdapter(adapter_config) as adapter:
-            tools = adapter.list_tools()
-            
-            assert len(tools) == 1
-            assert tools[0].name == "test_tool"
-            assert tools[0].description == "Test tool description"
-
-
-@pytest.mark.asyncio
-async def test_get_tool(adapter_config, mock_utcp_tool):
-    """Test getting specific tool."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = [mock_utcp_tool]
-        
-        async with UtcpToolAdapter(adapter_config) as adapter:
-            tool = adapter.get_tool("test_tool")
-            assert tool is not None
-            assert tool.name == "test_tool"
-            
-            # Test non-existent tool
-            missing_tool = adapter.get_tool("missing_tool")
-            assert missing_tool is None
-
-
-@pytest.mark.asyncio
-async def test_call_tool(adapter_config, mock_utcp_tool):
-    """Test calling a tool."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = [mock_utcp_tool]
+@pytest.mark.parametrize("action", ["list", "get", "to_strands"])
+def test_adapter_read_operations(started_adapter, action):
+    """Test the synchronous list/get/to_strands lookups against the shared started adapter."""
+    adapter, _ = started_adapter
+    
+    if action == "list":
+        tools = adapter.list_tools()
+        # list_tools hands out the same read-only snapshot instead of copying
+        assert isinstance(tools, tuple)
+        assert adapter.list_tools() is tools
+        assert tools[0].description == "Test tool description"
+        assert [tool.name for tool in tools] == ["test_tool"]
+    elif action == "get":
+        assert adapter.get_tool("missing_tool") is None
+        assert adapter.get_tool("test_tool").name == "test_tool"
+    else:
+        tools = adapter.to_strands_tools()
+        assert isinstance(tools, list)
+        assert adapter.to_strands_tools() is not tools
+        assert [tool.name for tool in tools] == ["test_tool"]
+
+
+@pytest.mark.parametrize("action, expected", [
+    ("search", ["test_tool"]),
+    ("call", {"result": "success"}),
+])
+async def test_adapter_client_operations(started_adapter, action, expected):
+    """Test search/call, which go through the client, against the shared started adapter."""
+    adapter, mock_client = started_adapter
+    
+    if action == "search":
+        tools = await adapter.search_tools("test", max_results=10)
+        # Tools already loaded at start() are returned as the same wrapper objects
+        assert tools[0] is adapter.get_tool("test_tool")
+        mock_client.search_tools.assert_called_once_with(query="test", limit=10)
+        result = [tool.name for tool in tools]
+    else:
         mock_client.call_tool.return_value = {"result": "success"}
-        
-        async with UtcpToolAdapter(adapter_config) as adapter:
-            result = await adapter.call_tool("test_tool", {"param1": "value1"})
-            
-            assert result == {"result": "success"}
-            mock_client.call_tool.assert_called_once_with(
-                tool_name="test_tool",
-                tool_args={"param1": "value1"}
-            )
-
-
-@pytest.mark.asyncio
-async def test_call_tool_not_initialized():
-    """Test calling tool when adapter not initialized."""
+        result = await adapter.call_tool("test_tool", {"param1": "value1"})
+        mock_client.call_tool.assert_called_once_with(
+            tool_name="test_tool",
+            tool_args={"param1": "value1"}
+        )
+    
+    assert result == expected
+
+
+@pytest.mark.parametrize("method, args", [
+    ("call_tool", ("test_tool", {})),
+    ("search_tools", ("test",)),
+])
+async def test_client_operations_not_initialized(method, args):
+    """Test that call_tool and search_tools fail on an adapter that was never started."""
     adapter = UtcpToolAdapter()
     
-    with pytest.raises(UtcpToolAdapterError, match="UTCP client not initialized"):
-        await adapter.call_tool("test_tool", {})
+    with pytest.raises(UtcpToolAdapterError) as exc_info:
+        await getattr(adapter, method)(*args)
+    assert str(exc_info.value) == "UTCP client not initialized"
 
 
-@pytest.mark.asyncio
-async def test_search_tools(adapter_config, mock_utcp_tool):
-    """Test searching tools."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = [mock_utcp_tool]
-        
-        async with UtcpToolAdapter(adapter_config) as adapter:
-            # Initial search_tools call during start() loads tools
-            # Now test the search functionality
-            mock_client.search_tools.return_value = [mock_utcp_tool]
-            
-            results = await adapter.search_tools("test", max_results=10)
-            
-            assert len(results) == 1
-            assert results[0].name == "test_tool"
-            
-            # Verify the search was called with correct parameters
-            # Note: search_tools is called twice - once during start() and once in our test
-            assert mock_client.search_tools.call_count >= 2
-
-
-@pytest.mark.asyncio
-async def test_to_strands_tools(adapter_config, mock_utcp_tool):
-    """Test converting to Strands tools format."""
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = [mock_utcp_tool]
-        
-        async with UtcpToolAdapter(adapter_config) as adapter:
-            strands_tools = adapter.to_strands_tools()
-            
-            assert len(strands_tools) == 1
-            tool_spec = strands_tools[0]
-            
-            assert tool_spec.name == "test_tool"
+async def test_search_tools_cached(adapter_config, utcp_tools):
+    """Test that repeated searches are served from the adapter's search cache."""
+    calls = 0
+    
+    async def _search(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return utcp_tools
+    
+    client = StubClient()
+    client.search_tools = _search
+    adapter = _prewire(client, adapter_config)
+    
+    first = await adapter.search_tools("test", max_results=10)
+    second = await adapter.search_tools("test", max_results=10)
+    await adapter.search_tools("other", max_results=10)
+    
+    assert [t.name for t in first] == [t.name for t in second] == ["test_tool"]
+    assert first is not second
+    # One search per distinct (query, limit)
+    assert calls == 2
+
+
+async def test_search_tools_failure_not_cached(adapter_config, utcp_tools):
+    """Test that failed searches return no tools and are retried next time."""
+    mock_client = AsyncMock(spec=UtcpClient)
+    mock_client.search_tools.side_effect = [Exception("boom"), utcp_tools]
+    adapter = _prewire(mock_client, adapter_config)
+    
+    assert await adapter.search_tools("test") == []
+    results = await adapter.search_tools("test")
+    
+    assert len(results) == 1
 
 
-def test_utcp_agent_tool_properties(mock_utcp_tool):
+def test_utcp_agent_tool_properties(agent_tool):
     """Test UtcpAgentTool properties."""
-    from strands_utcp.utcp_tool_adapter import UtcpAgentTool
+    assert agent_tool.name == "test_tool"
+    assert agent_tool.description == "Test tool description"
     
-    adapter = MagicMock()
-    tool = UtcpAgentTool(mock_utcp_tool, adapter)
+    schema = agent_tool.input_schema
+    assert schema == EXPECTED_SCHEMA
     
-    assert tool.name == "test_tool"
-    assert tool.description == "Test tool description"
+    # tool_spec embeds the same schema object rather than a rebuilt copy
+    assert agent_tool.tool_spec["inputSchema"]["json"] is schema
+    assert agent_tool.tool_spec == {
+        "inputSchema": {"json": EXPECTED_SCHEMA},
+        "name": "test_tool",
+        "description": "Test tool description",
+    }
+
+
+def test_utcp_agent_tool_schema_conversion():
+    """Test conversion of UTCP JsonSchema properties to plain dictionaries."""
+    mock_tool = FakeUtcpTool("test_tool", inputs=FakeInputs(properties={
+        "upload": JsonSchema(type="file", description="File to upload"),
+        "mode": JsonSchema(type="string", enum=["fast", "slow"]),
+        "when": JsonSchema(type="string", format="date-time"),
+        "untyped": JsonSchema(),
+    }))
+    
+    tool = UtcpAgentTool(mock_tool, object())
+    
+    assert tool.input_schema["properties"] == {
+        "upload": {"type": "string", "description": "File to upload"},
+        "mode": {"type": "string", "enum": ["fast", "slow"]},
+        "when": {"type": "string", "format": "date-time"},
+        "untyped": {"type": "string"},
+    }
+
+
+def test_utcp_agent_tool_schema_built_lazily(agent_tool, monkeypatch):
+    """Test that the input schema is only built on first access and then reused."""
+    mock_build = MagicMock(wraps=agent_tool._build_schema)
+    monkeypatch.setattr(UtcpAgentTool, "_build_schema", mock_build)
     
-    schema = tool.input_schema
-    assert schema["type"] == "object"
-    assert schema["properties"] == {"param1": {"type": "string"}}
-    assert schema["required"] == ["param1"]
-    assert schema["description"] == "Test input schema"
+    assert agent_tool.tool_spec["inputSchema"]["json"] is agent_tool.input_schema
+    mock_build.assert_called_once()
 
 
 def test_utcp_agent_tool_name_sanitization():
     """Test tool name sanitization."""
-    from strands_utcp.utcp_tool_adapter import UtcpAgentTool
-    
-    mock_tool = MagicMock()
-    mock_tool.name = "api.v1.get_data"  # Name with dots
-    mock_tool.description = "Test tool"
-    mock_tool.inputs.type = "object"
-    mock_tool.inputs.properties = {}
-    mock_tool.inputs.required = []
-    mock_tool.inputs.description = None
+    mock_tool = FakeUtcpTool("api.v1.get_data", "Test tool")  # Name with dots
     
-    adapter = MagicMock()
-    tool = UtcpAgentTool(mock_tool, adapter)
+    tool = UtcpAgentTool(mock_tool, object())
     
     # Dots should be replaced with underscores
     assert tool.name == "api_v1_get_data"
 
 
-@pytest.mark.asyncio
-async def test_utcp_agent_tool_call():
-    """Test UtcpAgentTool call method."""
-    from strands_utcp.utcp_tool_adapter import UtcpAgentTool
+@pytest.mark.parametrize("raw, expected", [
+    ("api.v1.get_data", "api_v1_get_data"),
+    ("my-tool_name", "my-tool_name"),
+    ("weird name/with:chars", "weird_name_with_chars"),
+    ("caf\u00e9", "caf_"),
+])
+def test_format_tool_name_for_bedrock(raw, expected):
+    """Test that invalid characters are replaced with underscores."""
+    assert format_tool_name_for_bedrock(raw) == expected
+
+
+def test_utcp_agent_tool_name_stable_when_truncated():
+    """Test that truncated tool names are computed once and stay stable."""
+    mock_tool = FakeUtcpTool("manual." + "a" * 80, "Test tool")
     
-    mock_utcp_tool = MagicMock()
-    mock_utcp_tool.name = "test_tool"
+    tool = UtcpAgentTool(mock_tool, object())
     
-    mock_adapter = AsyncMock()
-    mock_adapter.call_tool.return_value = {"result": "success"}
+    assert len(tool.name) == 64
+    assert tool.name == tool.tool_name == tool.tool_spec["name"]
+
+
+async def test_get_tool_by_utcp_name(stub_client):
+    """Test that tools can be looked up by their original UTCP name."""
+    stub_client.tools = (FakeUtcpTool("api.v1.get_data", "Test tool"),)
     
-    tool = UtcpAgentTool(mock_utcp_tool, mock_adapter)
+    adapter = await UtcpToolAdapter().start()
+    by_utcp_name = adapter.get_tool("api.v1.get_data")
+    by_bedrock_name = adapter.get_tool("api_v1_get_data")
+    
+    assert by_utcp_name is not None
+    assert by_utcp_name is by_bedrock_name
+    
+    await adapter.stop()
+    assert adapter.get_tool("api_v1_get_data") is None
+
+
+async def test_utcp_agent_tool_call(mock_utcp_tool):
+    """Test UtcpAgentTool call method."""
+    calls = []
+    
+    async def call_tool(tool_name, arguments):
+        calls.append((tool_name, arguments))
+        return {"result": "success"}
+    
+    tool = UtcpAgentTool(mock_utcp_tool, SimpleNamespace(call_tool=call_tool))
     result = await tool.call(param1="value1")
     
     assert result == {"result": "success"}
-    mock_adapter.call_tool.assert_called_once_with("test_tool", {"param1": "value1"})
+    assert calls == [("test_tool", {"param1": "value1"})]
 
 
-@pytest.mark.asyncio
-async def test_http_call_template_auth_passthrough():
-    """Test that auth parameters are passed through to HttpCallTemplate."""
-    from strands_utcp.utcp_tool_adapter import HttpCallTemplate
+async def test_utcp_agent_tool_stream_success(mock_utcp_tool):
+    """Test that stream yields a single successful ToolResultEvent."""
+    mock_adapter = FastAsyncMock()
+    mock_adapter.call_tool.return_value = {"result": "success"}
+    tool = UtcpAgentTool(mock_utcp_tool, mock_adapter)
     
-    config = {
-        "manual_call_templates": [
-            {
-                "name": "test_api",
-                "call_template_type": "http",
-                "url": "https://api.test.com/utcp",
-                "http_method": "POST",
-                "auth": {
-                    "auth_type": "api_key",
-                    "api_key": "Bearer ${MY_BEARER_TOKEN}",
-                    "var_name": "Authorization",
-                    "location": "header"
-                },
-                "auth_tools": ["tool1", "tool2"],
-                "headers": {"X-Custom-Header": "value"},
-                "body_field": "data",
-                "header_fields": ["X-Request-ID"]
-            }
-        ]
-    }
+    tool_use = {"toolUseId": "abc", "name": "test_tool", "input": {"param1": "value1"}}
+    events = [event async for event in tool.stream(tool_use, {})]
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.HttpCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                # Verify HttpCallTemplate was called with all parameters
-                mock_template_class.assert_called_once()
-                call_kwargs = mock_template_class.call_args[1]
-                
-                assert call_kwargs["name"] == "test_api"
-                assert call_kwargs["call_template_type"] == "http"
-                assert call_kwargs["url"] == "https://api.test.com/utcp"
-                assert call_kwargs["http_method"] == "POST"
-                assert call_kwargs["auth"] == config["manual_call_templates"][0]["auth"]
-                assert call_kwargs["auth_tools"] == ["tool1", "tool2"]
-                assert call_kwargs["headers"] == {"X-Custom-Header": "value"}
-                assert call_kwargs["body_field"] == "data"
-                assert call_kwargs["header_fields"] == ["X-Request-ID"]
-
-
-@pytest.mark.asyncio
-async def test_sse_call_template_auth_passthrough():
-    """Test that auth and SSE-specific parameters are passed through to SseCallTemplate."""
-    from strands_utcp.utcp_tool_adapter import SseCallTemplate
+    assert len(events) == 1
+    tool_result = events[0].tool_result
+    assert tool_result["toolUseId"] == "abc"
+    assert tool_result["status"] == "success"
+    assert json.loads(tool_result["content"][0]["text"]) == {"result": "success"}
+    mock_adapter.call_tool.assert_called_once_with("test_tool", {"param1": "value1"})
+
+
+async def test_utcp_agent_tool_stream_error(mock_utcp_tool):
+    """Test that stream reports tool failures as an error ToolResultEvent."""
+    mock_adapter = FastAsyncMock()
+    mock_adapter.call_tool.side_effect = UtcpToolAdapterError("Tool execution failed: boom")
+    tool = UtcpAgentTool(mock_utcp_tool, mock_adapter)
     
-    config = {
-        "manual_call_templates": [
-            {
-                "name": "test_sse",
-                "call_template_type": "sse",
-                "url": "https://api.test.com/sse",
-                "http_method": "GET",
-                "auth": {
-                    "auth_type": "bearer",
-                    "token": "${MY_TOKEN}"
-                },
-                "headers": {"Accept": "text/event-stream"},
-                "body_field": "payload",
-                "header_fields": ["X-Event-ID"],
-                "event_type": "message",
-                "reconnect": True,
-                "retry_timeout": 5000
-            }
-        ]
-    }
+    events = [event async for event in tool.stream({"input": {}}, {})]
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.SseCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                # Verify SseCallTemplate was called with all parameters
-                mock_template_class.assert_called_once()
-                call_kwargs = mock_template_class.call_args[1]
-                
-                assert call_kwargs["name"] == "test_sse"
-                assert call_kwargs["call_template_type"] == "sse"
-                assert call_kwargs["url"] == "https://api.test.com/sse"
-                assert call_kwargs["http_method"] == "GET"
-                assert call_kwargs["auth"] == config["manual_call_templates"][0]["auth"]
-                assert call_kwargs["headers"] == {"Accept": "text/event-stream"}
-                assert call_kwargs["body_field"] == "payload"
-                assert call_kwargs["header_fields"] == ["X-Event-ID"]
-                assert call_kwargs["event_type"] == "message"
-                assert call_kwargs["reconnect"] is True
-                assert call_kwargs["retry_timeout"] == 5000
-
-
-@pytest.mark.asyncio
-async def test_streamable_http_call_template_auth_passthrough():
-    """Test that auth and streamable-specific parameters are passed through to StreamableHttpCallTemplate."""
-    from strands_utcp.utcp_tool_adapter import StreamableHttpCallTemplate
+    assert len(events) == 1
+    tool_result = events[0].tool_result
+    assert tool_result["toolUseId"] == "unknown"
+    assert tool_result["status"] == "error"
+    assert tool_result["content"] == [{"text": "Error: Tool execution failed: boom"}]
+
+
+@pytest.mark.parametrize("template_config", [
+    _HTTP_TEMPLATE,
+    _SSE_TEMPLATE,
+    _STREAMABLE_HTTP_TEMPLATE,
+], ids=["http", "sse", "streamable_http"])
+def test_call_template_auth_passthrough(template_kwargs, template_config):
+    """Test that auth and type-specific parameters are passed through to the template class."""
+    UtcpToolAdapter({"manual_call_templates": [template_config]})._build_call_templates()
     
-    config = {
-        "manual_call_templates": [
-            {
-                "name": "test_streamable",
-                "call_template_type": "streamable_http",
-                "url": "https://api.test.com/stream",
-                "http_method": "POST",
-                "auth": {
-                    "auth_type": "basic",
-                    "username": "${MY_USERNAME}",
-                    "password": "${MY_PASSWORD}"
-                },
-                "headers": {"Content-Type": "application/octet-stream"},
-                "body_field": "chunk",
-                "header_fields": ["X-Chunk-Size"],
-                "chunk_size": 8192,
-                "timeout": 30.0
-            }
-        ]
-    }
+    # Verify the template class was called once, with all parameters
+    (call_kwargs,) = template_kwargs[template_config["call_template_type"]]
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.StreamableHttpCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                # Verify StreamableHttpCallTemplate was called with all parameters
-                mock_template_class.assert_called_once()
-                call_kwargs = mock_template_class.call_args[1]
-                
-                assert call_kwargs["name"] == "test_streamable"
-                assert call_kwargs["call_template_type"] == "streamable_http"
-                assert call_kwargs["url"] == "https://api.test.com/stream"
-                assert call_kwargs["http_method"] == "POST"
-                assert call_kwargs["auth"] == config["manual_call_templates"][0]["auth"]
-                assert call_kwargs["headers"] == {"Content-Type": "application/octet-stream"}
-                assert call_kwargs["body_field"] == "chunk"
-                assert call_kwargs["header_fields"] == ["X-Chunk-Size"]
-                assert call_kwargs["chunk_size"] == 8192
-                assert call_kwargs["timeout"] == 30.0
-
-
-@pytest.mark.asyncio
-async def test_http_call_template_optional_params_not_required():
+    for key, value in template_config.items():
+        assert call_kwargs[key] == value
+
+
+def test_http_call_template_optional_params_not_required(template_kwargs):
     """Test that HttpCallTemplate works without optional auth/headers parameters."""
     config = {
         "manual_call_templates": [
@@ -420,148 +544,61 @@ async def test_http_call_template_optional_params_not_required():
         ]
     }
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.HttpCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                # Verify HttpCallTemplate was called with only required parameters
-                mock_template_class.assert_called_once()
-                call_kwargs = mock_template_class.call_args[1]
-                
-                assert call_kwargs["name"] == "simple_api"
-                assert call_kwargs["url"] == "https://api.test.com/simple"
-                assert call_kwargs["http_method"] == "GET"
-                # Optional parameters should not be in kwargs if not provided
-                assert "auth" not in call_kwargs
-                assert "headers" not in call_kwargs
-
-
-@pytest.mark.asyncio
-async def test_sse_template_minimal_params():
-    """Test SseCallTemplate with only required parameters, no SSE-specific fields."""
-    config = {
-        "manual_call_templates": [
-            {
-                "name": "minimal_sse",
-                "call_template_type": "sse",
-                "url": "https://api.test.com/sse"
-            }
-        ]
-    }
+    UtcpToolAdapter(config)._build_call_templates()
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.SseCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                call_kwargs = mock_template_class.call_args[1]
-                # Verify SSE-specific fields are not present
-                assert "event_type" not in call_kwargs
-                assert "reconnect" not in call_kwargs
-                assert "retry_timeout" not in call_kwargs
-                # But common fields are present with defaults
-                assert call_kwargs["http_method"] == "GET"
-                assert call_kwargs["content_type"] == "application/json"
-
-
-@pytest.mark.asyncio
-async def test_streamable_http_minimal_params():
-    """Test StreamableHttpCallTemplate with only required parameters."""
-    config = {
-        "manual_call_templates": [
-            {
-                "name": "minimal_stream",
-                "call_template_type": "streamable_http",
-                "url": "https://api.test.com/stream"
-            }
-        ]
-    }
+    # Verify HttpCallTemplate was called once, with only required parameters
+    (call_kwargs,) = template_kwargs["http"]
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.StreamableHttpCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                call_kwargs = mock_template_class.call_args[1]
-                # Verify streamable-specific fields are not present
-                assert "chunk_size" not in call_kwargs
-                assert "timeout" not in call_kwargs
-                # But common fields are present with defaults
-                assert call_kwargs["http_method"] == "GET"
-                assert call_kwargs["content_type"] == "application/json"
-
-
-@pytest.mark.asyncio
-async def test_multiple_mixed_templates():
+    assert call_kwargs["name"] == "simple_api"
+    assert call_kwargs["url"] == "https://api.test.com/simple"
+    assert call_kwargs["http_method"] == "GET"
+    # Optional parameters should not be in kwargs if not provided
+    assert "auth" not in call_kwargs
+    assert "headers" not in call_kwargs
+
+
+@pytest.mark.parametrize("template_config, absent_fields", [
+    (
+        {"name": "minimal_sse", "call_template_type": "sse", "url": "https://api.test.com/sse"},
+        ("event_type", "reconnect", "retry_timeout"),
+    ),
+    (
+        {"name": "minimal_stream", "call_template_type": "streamable_http", "url": "https://api.test.com/stream"},
+        ("chunk_size", "timeout"),
+    ),
+], ids=["sse", "streamable_http"])
+def test_template_minimal_params(template_kwargs, template_config, absent_fields):
+    """Test SSE and streamable HTTP templates with only required parameters."""
+    UtcpToolAdapter({"manual_call_templates": [template_config]})._build_call_templates()
+    
+    (call_kwargs,) = template_kwargs[template_config["call_template_type"]]
+    # Verify type-specific fields are not present
+    for field_name in absent_fields:
+        assert field_name not in call_kwargs
+    # But common fields are present with defaults
+    assert call_kwargs["http_method"] == "GET"
+    assert call_kwargs["content_type"] == "application/json"
+
+
+def test_multiple_mixed_templates(template_kwargs):
     """Test configuration with multiple template types in one config."""
-    config = {
-        "manual_call_templates": [
-            {
-                "name": "api1",
-                "call_template_type": "http",
-                "url": "http://api1.com"
-            },
-            {
-                "name": "sse1",
-                "call_template_type": "sse",
-                "url": "http://sse1.com"
-            },
-            {
-                "name": "stream1",
-                "call_template_type": "streamable_http",
-                "url": "http://stream.com"
-            }
-        ]
-    }
+    UtcpToolAdapter(_MIXED_TEMPLATES_CONFIG)._build_call_templates()
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.HttpCallTemplate') as mock_http:
-                with patch('strands_utcp.utcp_tool_adapter.SseCallTemplate') as mock_sse:
-                    with patch('strands_utcp.utcp_tool_adapter.StreamableHttpCallTemplate') as mock_stream:
-                        adapter = UtcpToolAdapter(config)
-                        await adapter.start()
-                        
-                        # Verify each template type was instantiated once
-                        mock_http.assert_called_once()
-                        mock_sse.assert_called_once()
-                        mock_stream.assert_called_once()
-                        
-                        # Verify the correct URLs were used
-                        http_kwargs = mock_http.call_args[1]
-                        sse_kwargs = mock_sse.call_args[1]
-                        stream_kwargs = mock_stream.call_args[1]
-                        
-                        assert http_kwargs["name"] == "api1"
-                        assert http_kwargs["url"] == "http://api1.com"
-                        assert sse_kwargs["name"] == "sse1"
-                        assert sse_kwargs["url"] == "http://sse1.com"
-                        assert stream_kwargs["name"] == "stream1"
-                        assert stream_kwargs["url"] == "http://stream.com"
-
-
-@pytest.mark.asyncio
-async def test_content_type_default():
+    # Verify each template type was instantiated once
+    (http_kwargs,) = template_kwargs["http"]
+    (sse_kwargs,) = template_kwargs["sse"]
+    (stream_kwargs,) = template_kwargs["streamable_http"]
+    
+    # Verify the correct URLs were used
+    assert http_kwargs["name"] == "api1"
+    assert http_kwargs["url"] == "http://api1.com"
+    assert sse_kwargs["name"] == "sse1"
+    assert sse_kwargs["url"] == "http://sse1.com"
+    assert stream_kwargs["name"] == "stream1"
+    assert stream_kwargs["url"] == "http://stream.com"
+
+
+def test_content_type_default(template_kwargs):
     """Test that content_type defaults to application/json when not specified."""
     config = {
         "manual_call_templates": [
@@ -573,22 +610,13 @@ async def test_content_type_default():
         ]
     }
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.HttpCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                call_kwargs = mock_template_class.call_args[1]
-                assert call_kwargs["content_type"] == "application/json"
+    UtcpToolAdapter(config)._build_call_templates()
+    
+    (call_kwargs,) = template_kwargs["http"]
+    assert call_kwargs["content_type"] == "application/json"
 
 
-@pytest.mark.asyncio
-async def test_content_type_override():
+def test_content_type_override(template_kwargs):
     """Test that content_type can be overridden."""
     config = {
         "manual_call_templates": [
@@ -601,15 +629,77 @@ async def test_content_type_override():
         ]
     }
     
-    with patch('strands_utcp.utcp_tool_adapter.UtcpClient') as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client_class.create = AsyncMock(return_value=mock_client)
-        mock_client.search_tools.return_value = []
-        
-        with patch('strands_utcp.utcp_tool_adapter.UtcpClientConfig') as mock_config_class:
-            with patch('strands_utcp.utcp_tool_adapter.HttpCallTemplate') as mock_template_class:
-                adapter = UtcpToolAdapter(config)
-                await adapter.start()
-                
-                call_kwargs = mock_template_class.call_args[1]
-                assert call_kwargs["content_type"] == "application/xml"
+    UtcpToolAdapter(config)._build_call_templates()
+    
+    (call_kwargs,) = template_kwargs["http"]
+    assert call_kwargs["content_type"] == "application/xml"
+
+
+def test_build_call_templates_uses_real_classes():
+    """Test that the HTTP-family specs build instances of the real template classes."""
+    call_templates = UtcpToolAdapter(_MIXED_TEMPLATES_CONFIG)._build_call_templates()
+    
+    assert [type(t) for t in call_templates] == [HttpCallTemplate, SseCallTemplate, StreamableHttpCallTemplate]
+    assert [t.url for t in call_templates] == ["http://api1.com", "http://sse1.com", "http://stream.com"]
+
+
+def test_unsupported_template_type_skipped(caplog, template_kwargs):
+    """Test that unknown or unavailable template types are skipped with a warning."""
+    config = {
+        "manual_call_templates": [
+            {
+                "name": "unknown",
+                "call_template_type": "carrier_pigeon",
+            },
+            {
+                "name": "api",
+                "call_template_type": "http",
+                "url": "https://api.test.com"
+            }
+        ]
+    }
+    
+    call_templates = UtcpToolAdapter(config)._build_call_templates()
+    
+    assert call_templates == template_kwargs["http"]
+    assert "carrier_pigeon" in caplog.text
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_result(use_orjson, monkeypatch):
+    """Test that both encoders produce the same text, non-string keys and non-ASCII included."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+        orjson_module = utcp_tool_adapter.orjson
+    else:
+        orjson_module = None
+    
+    monkeypatch.setattr(utcp_tool_adapter, "orjson", orjson_module)
+    # Any stdlib fallback would fail the orjson case
+    stdlib_dumps = MagicMock(wraps=json.dumps)
+    monkeypatch.setattr(utcp_tool_adapter.json, "dumps", stdlib_dumps)
+    content = utcp_tool_adapter._dumps_result({"name": "Rex", "tags": ["dog"], 1: "café"})
+    
+    assert content == '{\n  "name": "Rex",\n  "tags": [\n    "dog"\n  ],\n  "1": "café"\n}'
+    assert stdlib_dumps.called is not use_orjson
+
+
+def test_dumps_result_orjson_overflow(monkeypatch):
+    """Test that integers wider than 64 bits fall back from orjson to the stdlib encoder."""
+    pytest.importorskip("orjson")
+    stdlib_dumps = MagicMock(wraps=json.dumps)
+    monkeypatch.setattr(utcp_tool_adapter.json, "dumps", stdlib_dumps)
+    
+    content = utcp_tool_adapter._dumps_result({"big": 2 ** 70})
+    
+    assert json.loads(content) == {"big": 2 ** 70}
+    stdlib_dumps.assert_called_once()
+
+
+def test_optional_import():
+    """Test optional imports of modules and attributes for installed, missing and incompatible packages."""
+    assert _optional_import("utcp_http.http_call_template", "HttpCallTemplate") is not None
+    assert _optional_import("utcp_not_installed.module", "Template") is None
+    assert _optional_import("utcp_http.no_such_module", "Template") is None
+    assert _optional_import("utcp_http.http_call_template", "NoSuchTemplate") is None
+    assert _optional_import("json") is json